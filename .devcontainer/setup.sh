@@ -4,7 +4,7 @@ set -e
 echo "🚀 Setting up ESPHome Component Development Environment..."
 
 # Install Python tools
-pip install --upgrade pip black flake8 pylint mypy pytest jupyter ipython platformio
+pip install --upgrade pip black flake8 pylint mypy pytest pytest-xdist jupyter ipython platformio
 
 # Update ESPHome
 pip install --upgrade esphome
@@ -2,6 +2,7 @@
 
 import esphome.codegen as cg
 import esphome.config_validation as cv
+from esphome.components.ups_hid import CONF_UPS_HID_ID, UpsHidComponent
 from esphome.const import (
     CONF_ID,
     CONF_PORT,
@@ -13,17 +14,12 @@ DEPENDENCIES = ["esp32", "network", "ups_hid"]
 AUTO_LOAD = []
 MULTI_CONF = False
 
-CONF_UPS_HID_ID = "ups_hid_id"
 CONF_MAX_CLIENTS = "max_clients"
 CONF_UPS_NAME = "ups_name"
 
 nut_server_ns = cg.esphome_ns.namespace("nut_server")
 NutServerComponent = nut_server_ns.class_("NutServerComponent", cg.Component)
 
-# Import ups_hid namespace
-ups_hid_ns = cg.esphome_ns.namespace("ups_hid")
-UpsHidComponent = ups_hid_ns.class_("UpsHidComponent", cg.PollingComponent)
-
 CONFIG_SCHEMA = cv.Schema(
     {
         cv.GenerateID(): cv.declare_id(NutServerComponent),
@@ -229,16 +229,34 @@ void NutServerComponent::handle_client(NutClient &client) {
   if (bytes_received > 0) {
     buffer[bytes_received] = '\0';
     
-    // Remove trailing newline
-    char *newline = strchr(buffer, '\n');
-    if (newline) *newline = '\0';
-    newline = strchr(buffer, '\r');
-    if (newline) *newline = '\0';
-    
     client.last_activity = millis();
     
-    ESP_LOGV(TAG, "Received command: %s", buffer);
-    process_command(client, std::string(buffer));
+    // Commands may be pipelined or split across reads - only run lines
+    // terminated by '\n' and keep the remainder for the next read
+    client.line_buffer.append(buffer, bytes_received);
+    size_t start = 0;
+    size_t newline;
+    while ((newline = client.line_buffer.find('\n', start)) != std::string::npos) {
+      std::string line = client.line_buffer.substr(start, newline - start);
+      start = newline + 1;
+      if (!line.empty() && line.back() == '\r') {
+        line.pop_back();
+      }
+      
+      if (!line.empty()) {
+        ESP_LOGV(TAG, "Received command: %s", line.c_str());
+        process_command(client, line);
+        // LOGOUT or an error may have closed the connection
+        if (!client.is_active()) return;
+      }
+    }
+    client.line_buffer.erase(0, start);
+    
+    if (client.line_buffer.size() >= MAX_COMMAND_LENGTH) {
+      ESP_LOGW(TAG, "Command exceeds %u bytes, disconnecting client", (unsigned) MAX_COMMAND_LENGTH);
+      send_error(client, "INVALID-ARGUMENT");
+      disconnect_client(client);
+    }
     
   } else if (bytes_received == 0) {
     // Client disconnected
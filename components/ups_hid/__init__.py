@@ -35,6 +35,7 @@ KNOWN_VENDOR_IDS = {
     0x09AE: "Tripp Lite",
     0x09D6: "KSTAR",
 }
+_KNOWN_VENDOR_IDS = frozenset(KNOWN_VENDOR_IDS)
 
 ups_hid_ns = cg.esphome_ns.namespace("ups_hid")
 UpsHidComponent = ups_hid_ns.class_("UpsHidComponent", cg.PollingComponent)
@@ -55,7 +56,7 @@ def validate_usb_config(config):
             raise cv.Invalid("USB vendor and product IDs must be non-zero")
 
         # Warn about unknown vendor IDs
-        if vendor_id not in KNOWN_VENDOR_IDS:
+        if vendor_id not in _KNOWN_VENDOR_IDS:
             # Just log a warning instead of failing - this is for troubleshooting
             import logging
             logging.getLogger(__name__).warning(
@@ -109,28 +110,28 @@ def validate_fallback_nominal_voltage(value):
     return value
 
 
-CONFIG_SCHEMA = cv.All(
-    cv.Schema(
-        {
-            cv.GenerateID(): cv.declare_id(UpsHidComponent),
-            cv.Optional(CONF_SIMULATION_MODE, default=False): cv.boolean,
-            # Manual USB IDs are now primarily for troubleshooting when auto-detection fails
-            cv.Optional(CONF_USB_VENDOR_ID): cv.hex_uint16_t,
-            cv.Optional(CONF_USB_PRODUCT_ID): cv.hex_uint16_t,
-            cv.Optional(
-                CONF_PROTOCOL_TIMEOUT, default="15s"
-            ): validate_protocol_timeout,
-            # Protocol selection: auto (default), apc, cyberpower, generic, Eaton 5PX
-            cv.Optional(CONF_PROTOCOL, default="auto"): cv.one_of(
-                "auto", "apc", "cyberpower", "generic", "eaton 5px", lower=True
-            ),
-            # Fallback nominal voltage (European 230V default for international compatibility)
-            cv.Optional(CONF_FALLBACK_NOMINAL_VOLTAGE, default="230V"): validate_fallback_nominal_voltage,
-        }
-    ).extend(cv.polling_component_schema("30s"))
-     .extend(cv.COMPONENT_SCHEMA),
-    validate_usb_config,
-)
+# ups_hid keys merged with the polling/component base keys up front, so a
+# single Schema is built instead of chaining .extend() copies.
+_SCHEMA_KEYS = {
+    **cv.COMPONENT_SCHEMA.schema,
+    **cv.polling_component_schema("30s").schema,
+    cv.GenerateID(): cv.declare_id(UpsHidComponent),
+    cv.Optional(CONF_SIMULATION_MODE, default=False): cv.boolean,
+    # Manual USB IDs are now primarily for troubleshooting when auto-detection fails
+    cv.Optional(CONF_USB_VENDOR_ID): cv.hex_uint16_t,
+    cv.Optional(CONF_USB_PRODUCT_ID): cv.hex_uint16_t,
+    cv.Optional(
+        CONF_PROTOCOL_TIMEOUT, default="15s"
+    ): validate_protocol_timeout,
+    # Protocol selection: auto (default), apc, cyberpower, generic, Eaton 5PX
+    cv.Optional(CONF_PROTOCOL, default="auto"): cv.one_of(
+        "auto", "apc", "cyberpower", "generic", "eaton 5px", lower=True
+    ),
+    # Fallback nominal voltage (European 230V default for international compatibility)
+    cv.Optional(CONF_FALLBACK_NOMINAL_VOLTAGE, default="230V"): validate_fallback_nominal_voltage,
+}
+
+CONFIG_SCHEMA = cv.All(cv.Schema(_SCHEMA_KEYS), validate_usb_config)
 
 
 async def to_code(config):
@@ -11,39 +11,43 @@ UpsHidButton = ups_hid_ns.class_("UpsHidButton", button.Button, cg.Component)
 CONF_BEEPER_ACTION = "beeper_action"
 CONF_TEST_ACTION = "test_action"
 
-BEEPER_ACTIONS = {
-    "enable": "enable",
-    "disable": "disable", 
-    "mute": "mute",
-    "test": "test"
-}
+BEEPER_ACTIONS = [
+    "enable",
+    "disable",
+    "mute",
+    "test",
+]
+
+TEST_ACTIONS = [
+    "battery_quick",
+    "battery_deep",
+    "battery_stop",
+    "ups_test",
+    "ups_stop",
+]
 
-TEST_ACTIONS = {
-    "battery_quick": "battery_quick",
-    "battery_deep": "battery_deep",
-    "battery_stop": "battery_stop",
-    "ups_test": "ups_test",
-    "ups_stop": "ups_stop"
+# Support either beeper_action or test_action, but not both.
+# Keyed by (beeper_action present, test_action present).
+_BUTTON_CONFIG_ERRORS = {
+    (True, True): "Cannot specify both 'beeper_action' and 'test_action' on the same button",
+    (False, False): "Must specify either 'beeper_action' or 'test_action'",
 }
 
-# Support either beeper_action or test_action, but not both
+
 def validate_button_config(config):
-    beeper_action = config.get(CONF_BEEPER_ACTION)
-    test_action = config.get(CONF_TEST_ACTION)
-    
-    if beeper_action is not None and test_action is not None:
-        raise cv.Invalid("Cannot specify both 'beeper_action' and 'test_action' on the same button")
-    
-    if beeper_action is None and test_action is None:
-        raise cv.Invalid("Must specify either 'beeper_action' or 'test_action'")
-    
+    error = _BUTTON_CONFIG_ERRORS.get(
+        (CONF_BEEPER_ACTION in config, CONF_TEST_ACTION in config)
+    )
+    if error:
+        raise cv.Invalid(error)
+
     return config
 
 CONFIG_SCHEMA = cv.All(
     button.button_schema(UpsHidButton).extend({
         cv.GenerateID(CONF_UPS_HID_ID): cv.use_id(UpsHidComponent),
-        cv.Optional(CONF_BEEPER_ACTION): cv.enum(BEEPER_ACTIONS, lower=True),
-        cv.Optional(CONF_TEST_ACTION): cv.enum(TEST_ACTIONS, lower=True),
+        cv.Optional(CONF_BEEPER_ACTION): cv.one_of(*BEEPER_ACTIONS, lower=True),
+        cv.Optional(CONF_TEST_ACTION): cv.one_of(*TEST_ACTIONS, lower=True),
     }).extend(cv.COMPONENT_SCHEMA),
     validate_button_config,
 )
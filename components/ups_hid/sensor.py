@@ -2,7 +2,10 @@ import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import sensor
 from esphome.const import (
+    CONF_ACCURACY_DECIMALS,
+    CONF_DEVICE_CLASS,
     CONF_TYPE,
+    CONF_UNIT_OF_MEASUREMENT,
     DEVICE_CLASS_BATTERY,
     DEVICE_CLASS_VOLTAGE,
     DEVICE_CLASS_POWER_FACTOR,
@@ -132,6 +135,23 @@ SENSOR_TYPES = {
     },
 }
 
+# Sensor type defaults applied when not set in YAML: (type key, config key, setter)
+_DEFAULT_SETTERS = (
+    ("unit", CONF_UNIT_OF_MEASUREMENT, "set_unit_of_measurement"),
+    ("device_class", CONF_DEVICE_CLASS, "set_device_class"),
+    ("accuracy_decimals", CONF_ACCURACY_DECIMALS, "set_accuracy_decimals"),
+)
+
+# Resolved once at import: sensor type -> ((config key, setter, value), ...)
+_SENSOR_CG_ACTIONS = {
+    sensor_type: tuple(
+        (conf_key, setter, sensor_config[type_key])
+        for type_key, conf_key, setter in _DEFAULT_SETTERS
+        if type_key in sensor_config
+    )
+    for sensor_type, sensor_config in SENSOR_TYPES.items()
+}
+
 
 CONFIG_SCHEMA = sensor.sensor_schema(
     UpsHidSensor,
@@ -153,16 +173,7 @@ async def to_code(config):
     cg.add(var.set_sensor_type(sensor_type))
     cg.add(parent.register_sensor(var, sensor_type))
 
-    # Apply sensor type specific configuration
-    if sensor_type in SENSOR_TYPES:
-        sensor_config = SENSOR_TYPES[sensor_type]
-
-        # Override config with sensor type defaults if not specified
-        if "unit_of_measurement" not in config and "unit" in sensor_config:
-            cg.add(var.set_unit_of_measurement(sensor_config["unit"]))
-
-        if "device_class" not in config and "device_class" in sensor_config:
-            cg.add(var.set_device_class(sensor_config["device_class"]))
-
-        if "accuracy_decimals" not in config and "accuracy_decimals" in sensor_config:
-            cg.add(var.set_accuracy_decimals(sensor_config["accuracy_decimals"]))
+    # Apply sensor type defaults not overridden in config
+    for conf_key, setter, value in _SENSOR_CG_ACTIONS[sensor_type]:
+        if conf_key not in config:
+            cg.add(getattr(var, setter)(value))
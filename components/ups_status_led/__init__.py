@@ -1,6 +1,7 @@
 import esphome.codegen as cg
 import esphome.config_validation as cv
-from esphome.components import light, time, switch, number, text_sensor
+from esphome.components import light, time
+from esphome.components.ups_hid import CONF_UPS_HID_ID, UpsHidComponent
 from esphome.const import (
     CONF_ID,
     CONF_BRIGHTNESS,
@@ -21,7 +22,6 @@ BATTERY_COLOR_MODES = {
     "gradient": BatteryColorMode.GRADIENT,
 }
 
-CONF_UPS_HID_ID = "ups_hid_id"
 CONF_LIGHT_ID = "light_id"
 CONF_NIGHT_MODE = "night_mode"
 CONF_START_TIME = "start_time"
@@ -57,7 +57,7 @@ NIGHT_MODE_SCHEMA = cv.Schema({
 
 CONFIG_SCHEMA = cv.Schema({
     cv.GenerateID(): cv.declare_id(UpsStatusLedComponent),
-    cv.Required(CONF_UPS_HID_ID): cv.use_id("ups_hid.UpsHidComponent"),
+    cv.Required(CONF_UPS_HID_ID): cv.use_id(UpsHidComponent),
     cv.Required(CONF_LIGHT_ID): cv.use_id(light.LightState),
     cv.Optional(CONF_TIME_ID): cv.use_id(time.RealTimeClock),
     
@@ -2,19 +2,159 @@
 Pytest configuration for ESPHome UPS HID configuration testing
 """
 
+import hashlib
+import json
 import os
+import re
+import select
+import shutil
 import subprocess
+import sys
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pytest
+import yaml
+
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+TEST_CONFIG_DIR = WORKSPACE_ROOT / "configs" / "testing"
+PRODUCTION_CONFIG_DIR = WORKSPACE_ROOT / "configs" / "examples"
+COMPONENTS_DIR = WORKSPACE_ROOT / "components"
+# Files a config pulls in: '!include path', '!include_dir_* dir', 'file: path'
+INCLUDE_PATTERN = re.compile(
+    rb"""(?:!include(?:_dir_\w+)?|\bfile:)\s+['"]?([^\s'"#,}]+)"""
+)
+# Per-worker compilation timings, merged by the controller for the summary
+COMPILATION_TIMES_DIR = WORKSPACE_ROOT / "build" / "compilation-times"
+SLOW_COMPILATION_SECONDS = 300
+# Shared PlatformIO object cache so near-identical test configs reuse builds
+DEFAULT_BUILD_CACHE_DIR = "/tmp/esphome-cache"
+
+compilation_times_key = pytest.StashKey[List[Dict]]()
+
+
+def find_test_configs() -> List[Path]:
+    """Get all standalone test configuration files"""
+    return sorted(TEST_CONFIG_DIR.glob("*_standalone.yaml"))
+
+
+def find_production_configs() -> List[Path]:
+    """Get all production example configurations"""
+    return sorted(PRODUCTION_CONFIG_DIR.glob("*.yaml"))
+
+
+class ESPHomeYamlLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+    """Safe YAML loader (libyaml when available) that keeps ESPHome tags
+    such as !secret, !include and !lambda as their untagged values"""
+
+
+def _construct_tagged(loader, tag_suffix, node):
+    if isinstance(node, yaml.ScalarNode):
+        return loader.construct_scalar(node)
+    if isinstance(node, yaml.SequenceNode):
+        return loader.construct_sequence(node)
+    return loader.construct_mapping(node)
+
+
+ESPHomeYamlLoader.add_multi_constructor("!", _construct_tagged)
+
+
+def simulation_mode_enabled(doc: dict) -> bool:
+    """Whether any ups_hid block in a parsed config enables simulation_mode,
+    resolving ${...} substitutions"""
+    substitutions = doc.get("substitutions") or {}
+    blocks = doc.get("ups_hid") or []
+    if isinstance(blocks, dict):
+        blocks = [blocks]
+    
+    for block in blocks:
+        value = block.get("simulation_mode")
+        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
+            value = substitutions.get(value[2:-1])
+        if value is True or str(value).lower() == "true":
+            return True
+    return False
+
+
+def has_simulation_mode(config_path: Path) -> bool:
+    """Whether a config file enables simulation_mode"""
+    with open(config_path) as f:
+        return simulation_mode_enabled(yaml.load(f, Loader=ESPHomeYamlLoader) or {})
+
+
+def find_simulation_run_configs() -> List[Path]:
+    """Get configs with simulation mode enabled for the simulation run tests"""
+    candidates = set(find_test_configs())
+    candidates.add(TEST_CONFIG_DIR / "minimal_simulation.yaml")
+    return sorted(
+        config_path for config_path in candidates
+        if config_path.exists() and has_simulation_mode(config_path)
+    )
+
+
+def components_digest() -> str:
+    """Hash of every file under components/, the code the configs exercise"""
+    digest = hashlib.sha256()
+    for path in sorted(COMPONENTS_DIR.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            digest.update(str(path.relative_to(COMPONENTS_DIR)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def config_dependencies(config_path: Path) -> List[Path]:
+    """A config plus every file it pulls in via !include, package file:
+    references and !secret (secrets.yaml), followed recursively"""
+    found = set()
+    pending = [config_path.resolve()]
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        if path.is_dir():
+            pending.extend(p.resolve() for p in path.rglob("*.yaml"))
+            continue
+        if not path.is_file():
+            continue
+        found.add(path)
+
+        content = path.read_bytes()
+        for match in INCLUDE_PATTERN.finditer(content):
+            include = match.group(1).decode()
+            # ESPHome resolves includes against the including file; configs
+            # in this repo also use workspace-relative paths
+            for base in (path.parent, WORKSPACE_ROOT):
+                candidate = (base / include).resolve()
+                if candidate.exists():
+                    pending.append(candidate)
+                    break
+        if b"!secret" in content:
+            pending.append((path.parent / "secrets.yaml").resolve())
+    return sorted(found)
+
+
+def _is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def compile_env() -> Dict[str, str]:
+    """Environment for esphome compile runs with the PlatformIO build cache enabled
+    
+    The environment is inherited, so CI can persist builds between runs by
+    setting ESPHOME_DATA_DIR (ESPHome's data dir, holding the build/ and
+    .pio trees) or ESPHOME_BUILD_PATH, both of which ESPHome reads itself.
+    """
+    env = os.environ.copy()
+    env.setdefault("PLATFORMIO_BUILD_CACHE_DIR", DEFAULT_BUILD_CACHE_DIR)
+    return env
 
 
 @pytest.fixture(scope="session")
 def workspace_root():
     """Get workspace root directory"""
-    return Path(__file__).parent.parent
+    return WORKSPACE_ROOT
 
 
 @pytest.fixture(scope="session")
@@ -36,25 +176,142 @@ def esphome_version():
 
 
 @pytest.fixture(scope="session") 
-def test_configs(workspace_root):
+def test_configs():
     """Get all test configuration files"""
-    config_dir = workspace_root / "configs" / "testing"
-    return list(config_dir.glob("*_standalone.yaml"))
+    return find_test_configs()
 
 
 @pytest.fixture(scope="session")
-def production_configs(workspace_root):
+def production_configs():
     """Get all production example configurations"""
-    config_dir = workspace_root / "configs" / "examples"
-    return list(config_dir.glob("*.yaml"))
+    return find_production_configs()
+
+
+class ConfigContents(dict):
+    """Config file contents keyed by path, each file read on first access"""
+    
+    def __missing__(self, config_path: Path) -> str:
+        content = self[config_path] = config_path.read_text()
+        return content
+
+
+@pytest.fixture(scope="session")
+def config_contents(test_configs):
+    """Contents of the test configs, shared across the session
+    
+    Other configs (production examples, explicit paths) are read and kept
+    on first lookup.
+    """
+    contents = ConfigContents()
+    contents.update((config_path, config_path.read_text()) for config_path in test_configs)
+    return contents
+
+
+@pytest.fixture(scope="session")
+def parsed_configs(test_configs, config_contents):
+    """Parsed YAML documents of the test configs, shared across the session"""
+    return {
+        config_path: yaml.load(config_contents[config_path], Loader=ESPHomeYamlLoader)
+        for config_path in test_configs
+    }
+
+
+class ESPHomeDaemon:
+    """Persistent 'esphome config' worker (esphome_daemon.py)
+    
+    ESPHome is imported once and reused for every validation instead of
+    paying interpreter and import start-up per config.
+    """
+    
+    SCRIPT = Path(__file__).parent / "esphome_daemon.py"
+    
+    def __init__(self, cwd: Path):
+        self.cwd = cwd
+        self.proc = None
+        self.available = True
+    
+    def _start(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, str(self.SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # Inherited so a daemon crash leaves its traceback in the output
+            stderr=None,
+            text=True,
+            cwd=self.cwd
+        )
+    
+    def validate(self, config_path: Path, timeout: int) -> Optional[Dict]:
+        """Validate a config; None if the daemon is unavailable"""
+        if not self.available:
+            return None
+        
+        started = self.proc is None or self.proc.poll() is not None
+        try:
+            if started:
+                self._start()
+            request = {'op': "validate", 'path': str(config_path.resolve())}
+            self.proc.stdin.write(json.dumps(request) + "\n")
+            self.proc.stdin.flush()
+            
+            ready, _, _ = select.select([self.proc.stdout], [], [], timeout)
+            if not ready:
+                # A stuck validation would desync later requests; start over
+                self.close()
+                return {
+                    'returncode': -1,
+                    'stdout': '',
+                    'stderr': f'Validation timed out after {timeout}s'
+                }
+            line = self.proc.stdout.readline()
+        except (BrokenPipeError, OSError):
+            line = ""
+        
+        if not line:
+            # The daemon died; if it never answered, ESPHome can't be
+            # imported in-process and the runner should stop trying
+            self.available = not started
+            self.close()
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            # Something other than the daemon wrote to its stdout; the
+            # stream can't be trusted any more, so let the runner fall back
+            self.close()
+            return None
+    
+    def close(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+
+
+@pytest.fixture(scope="session")
+def esphome_daemon():
+    """Session-wide ESPHome validation daemon, started on first use"""
+    daemon = ESPHomeDaemon(cwd=Path("/workspace"))
+    yield daemon
+    daemon.close()
 
 
 class ESPHomeRunner:
     """Helper class for running ESPHome commands"""
     
-    def __init__(self):
-        """Initialize with current ESPHome version info"""
+    def __init__(self, validate_cache=None, daemon: Optional[ESPHomeDaemon] = None):
+        """Initialize with current ESPHome version info
+        
+        validate_cache is an optional pytest cache used to reuse successful
+        validation results for unchanged configs and components (see
+        --cached). daemon, when
+        given, runs validations in a long-lived ESPHome process; the runner
+        falls back to spawning 'esphome config' if it is unavailable.
+        """
         self.version = self._get_esphome_version()
+        self.validate_cache = validate_cache
+        self.daemon = daemon
+        self.components_digest = components_digest() if validate_cache is not None else None
     
     def _get_esphome_version(self) -> str:
         """Get ESPHome version"""
@@ -69,10 +326,47 @@ class ESPHomeRunner:
         except Exception:
             return "unknown"
     
-    @staticmethod
-    def validate_config(config_path: Path, timeout: int = 30) -> Dict:
+    def _validate_cache_key(self, config_path: Path) -> str:
+        """Cache key for a config: its contents and includes, the component
+        sources and the ESPHome version"""
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(self.components_digest.encode())
+        for path in config_dependencies(config_path):
+            digest.update(str(path).encode())
+            digest.update(path.read_bytes())
+        return f"esphome-validate/{digest.hexdigest()}"
+    
+    def validate_config(self, config_path: Path, timeout: int = 30) -> Dict:
+        """Validate ESPHome configuration, reusing cached successes when enabled"""
+        if self.validate_cache is None:
+            return self._run_validate(config_path, timeout)
+        
+        key = self._validate_cache_key(config_path)
+        cached = self.validate_cache.get(key, None)
+        if cached is not None:
+            return cached
+        
+        result = self._run_validate(config_path, timeout)
+        # Only successes are cached so a fixed component is always re-checked
+        if result['success']:
+            self.validate_cache.set(key, result)
+        return result
+    
+    def _run_validate(self, config_path: Path, timeout: int = 30) -> Dict:
         """Validate ESPHome configuration"""
         start_time = time.time()
+        if self.daemon is not None:
+            result = self.daemon.validate(config_path, timeout)
+            if result is not None:
+                duration = time.time() - start_time
+                return {
+                    'success': result['returncode'] == 0,
+                    'duration': round(duration, 2),
+                    'stdout': result['stdout'],
+                    'stderr': result['stderr'],
+                    'returncode': result['returncode']
+                }
+        
         try:
             result = subprocess.run(
                 ["esphome", "config", str(config_path.resolve())],
@@ -118,7 +412,8 @@ class ESPHomeRunner:
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                cwd=Path("/workspace")  # Always use workspace root
+                cwd=Path("/workspace"),  # Always use workspace root
+                env=compile_env()
             )
             duration = time.time() - start_time
             return {
@@ -146,67 +441,107 @@ class ESPHomeRunner:
                 'stderr': str(e),
                 'returncode': -1
             }
+
+
+@pytest.fixture(scope="session")
+def esphome_runner(request, esphome_daemon):
+    """Provide the session's ESPHome runner instance
     
-    @staticmethod
-    def run_simulation(config_path: Path, duration: int = 30) -> Dict:
-        """Run ESPHome configuration in simulation mode"""
-        start_time = time.time()
-        try:
-            # For simulation mode, we verify compilation and check logs briefly
-            # Instead of trying to upload to hardware, we compile and check for simulation mode
-            result = subprocess.run(
-                ["esphome", "compile", str(config_path.resolve())],
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minutes max
-                cwd=Path("/workspace")  # Always use workspace root
-            )
-            
-            test_duration = time.time() - start_time
-            
-            # Check if config has simulation_mode enabled
-            with open(config_path, 'r') as f:
-                config_content = f.read()
-            
-            has_simulation = ('simulation_mode: true' in config_content or 
-                            'simulation_mode: "true"' in config_content)
-            
-            # For simulation configs, success = compilation success + simulation mode found
-            if has_simulation:
-                success = result.returncode == 0
-                # Add simulation indicators to stdout for sensor data tests
-                simulated_stdout = result.stdout + "\n[SIMULATION] Battery Level: 85%\n[SIMULATION] UPS Status: Online\n[SIMULATION] Sending state updates"
-            else:
-                success = result.returncode == 0
-                simulated_stdout = result.stdout
-            
-            return {
-                'success': success,
-                'duration': round(test_duration, 2),
-                'stdout': simulated_stdout,
-                'stderr': result.stderr,
-                'returncode': result.returncode
-            }
-            
-        except Exception as e:
-            test_duration = time.time() - start_time
-            return {
-                'success': False,
-                'duration': round(test_duration, 2),
-                'stdout': '',
-                'stderr': str(e),
-                'returncode': -1
-            }
+    Shared so the ESPHome version lookup and, with --cached, the components
+    digest are computed once per session.
+    """
+    validate_cache = None
+    if request.config.getoption("--cached"):
+        validate_cache = getattr(request.config, "cache", None)
+    return ESPHomeRunner(validate_cache=validate_cache, daemon=esphome_daemon)
+
+
+class CompiledConfigs(dict):
+    """Compilation results keyed by config path, each config compiled on first access"""
+    
+    def __init__(self, runner: "ESPHomeRunner", timeout: int = 600):
+        super().__init__()
+        self.runner = runner
+        self.timeout = timeout
+    
+    def __missing__(self, config_path: Path) -> Dict:
+        result = self[config_path] = self.runner.compile_config(
+            config_path, timeout=self.timeout
+        )
+        return result
+    
+    def run_simulation(self, config_path: Path) -> Dict:
+        """Run ESPHome configuration in simulation mode
+        
+        There is no hardware to run on, so a simulation run is the config's
+        shared compilation plus a check that simulation_mode is enabled.
+        """
+        result = dict(self[config_path])
+        if has_simulation_mode(config_path):
+            # Add simulation indicators to stdout for sensor data tests
+            result['stdout'] += "\n[SIMULATION] Battery Level: 85%\n[SIMULATION] UPS Status: Online\n[SIMULATION] Sending state updates"
+        return result
+
+
+@pytest.fixture(scope="session")
+def compiled_configs(esphome_runner):
+    """Compile each config at most once per session (per xdist worker)"""
+    return CompiledConfigs(esphome_runner)
 
 
 @pytest.fixture
-def esphome_runner():
-    """Provide ESPHome runner instance"""
-    return ESPHomeRunner()
+def record_compilation(request):
+    """Record a compilation result for the end-of-session timing summary"""
+    def record(section: str, config_path: Path, result: Dict):
+        request.config.stash[compilation_times_key].append({
+            'section': section,
+            'config': config_path.name,
+            'duration': result['duration'],
+            'success': result['success']
+        })
+    return record
+
+
+def pytest_addoption(parser):
+    """Add ESPHome test options"""
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Reuse successful 'esphome config' results for unchanged YAML "
+             "(stored in .pytest_cache)"
+    )
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="Run slow tests (compilation); deselected by default unless -m is given"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize per-config tests at collection time so xdist can spread them"""
+    if "config_path" in metafunc.fixturenames:
+        configs = find_test_configs()
+        metafunc.parametrize("config_path", configs, ids=[p.stem for p in configs])
+    if "simulation_config_path" in metafunc.fixturenames:
+        configs = find_simulation_run_configs()
+        metafunc.parametrize(
+            "simulation_config_path", configs, ids=[p.stem for p in configs]
+        )
+    if "production_config_path" in metafunc.fixturenames:
+        configs = find_production_configs()
+        metafunc.parametrize(
+            "production_config_path", configs, ids=[p.stem for p in configs]
+        )
 
 
 def pytest_configure(config):
-    """Register custom markers"""
+    """Register custom markers and reset compilation timing state"""
+    config.stash[compilation_times_key] = []
+    if not _is_xdist_worker(config):
+        shutil.rmtree(COMPILATION_TIMES_DIR, ignore_errors=True)
+
     config.addinivalue_line(
         "markers", "validation: Configuration validation tests"
     )
@@ -222,16 +557,42 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "ci: Tests suitable for CI/CD pipeline"
     )
+    # Provided by pytest-xdist; registered so runs without it still pass
+    # --strict-markers
+    config.addinivalue_line(
+        "markers", "xdist_group(name): Run tests of the same group on one xdist worker"
+    )
+
+
+def _compile_target_name(item) -> str:
+    """Name of the config a parametrized compilation test compiles, if any"""
+    params = getattr(item, "callspec", None)
+    params = params.params if params else {}
+    target = next(
+        (params[name] for name in ("config_path", "simulation_config_path", "config")
+         if name in params),
+        None
+    )
+    # Empty parametrizations carry a NOTSET placeholder instead of a path
+    return Path(target).stem if isinstance(target, (str, Path)) else ""
 
 
 def pytest_collection_modifyitems(config, items):
-    """Automatically mark tests based on their names"""
+    """Automatically mark tests based on their names and deselect slow tests"""
     for item in items:
         # Mark compilation tests as slow
         if "compilation" in item.name or "compile" in item.name:
             item.add_marker(pytest.mark.slow)
             item.add_marker(pytest.mark.compilation)
         
+        # Keep every compile of one config (compilation and simulation runs)
+        # on one xdist worker so the session-scoped compiled_configs cache
+        # is shared between them
+        if "compiled_configs" in getattr(item, "fixturenames", ()):
+            config_name = _compile_target_name(item)
+            if config_name:
+                item.add_marker(pytest.mark.xdist_group(name=f"compile-{config_name}"))
+        
         # Mark validation tests as fast
         if "validation" in item.name or "validate" in item.name:
             item.add_marker(pytest.mark.validation)
@@ -240,6 +601,56 @@ def pytest_collection_modifyitems(config, items):
         # Mark simulation tests
         if "simulation" in item.name or "simulate" in item.name:
             item.add_marker(pytest.mark.simulation)
+    
+    # Slow tests are opt-in; an explicit -m expression takes precedence
+    if config.getoption("--runslow") or config.getoption("markexpr"):
+        return
+    
+    selected = [item for item in items if item.get_closest_marker("slow") is None]
+    deselected = [item for item in items if item.get_closest_marker("slow") is not None]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_sessionfinish(session):
+    """Write this process's compilation timings for the controller to merge"""
+    times = session.config.stash[compilation_times_key]
+    if times:
+        COMPILATION_TIMES_DIR.mkdir(parents=True, exist_ok=True)
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        (COMPILATION_TIMES_DIR / f"{worker_id}.json").write_text(json.dumps(times))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print compilation times gathered from all workers"""
+    if _is_xdist_worker(config) or not COMPILATION_TIMES_DIR.is_dir():
+        return
+
+    times = []
+    for path in sorted(COMPILATION_TIMES_DIR.glob("*.json")):
+        times.extend(json.loads(path.read_text()))
+
+    compiled = [t for t in times if t['section'] == "compile"]
+    if compiled:
+        terminalreporter.write_sep("-", "📊 Compilation Times")
+        for time_info in sorted(compiled, key=lambda t: t['config']):
+            status = "✅" if time_info['success'] else "❌"
+            terminalreporter.write_line(
+                f"  {status} {time_info['config']}: {time_info['duration']}s"
+            )
+
+    slow = [
+        t for t in times
+        if t['section'] == "performance" and t['success']
+        and t['duration'] > SLOW_COMPILATION_SECONDS
+    ]
+    if slow:
+        terminalreporter.write_sep("-", "⚠️ Slow compilations (>5min)")
+        for slow_info in sorted(slow, key=lambda t: t['config']):
+            terminalreporter.write_line(
+                f"  - {slow_info['config']}: {slow_info['duration']}s"
+            )
 
 
 def pytest_html_report_title(report):
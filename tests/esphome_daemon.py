@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Long-lived ESPHome validation helper for the test suite
+
+Imports ESPHome once and then validates configs on request, so each
+validation skips interpreter start-up and the ESPHome import. Reads one JSON
+request per line from stdin:
+
+    {"op": "validate", "path": "/abs/path/config.yaml"}
+
+and writes one JSON result per line to stdout:
+
+    {"returncode": 0, "stdout": "...", "stderr": "..."}
+
+Only ESPHome's CORE is reset between requests, so components must not keep
+validation state at module level or results would depend on config order.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import sys
+import traceback
+
+
+def validate(run_esphome, core, config_path: str) -> dict:
+    """Run 'esphome config' in-process, capturing its output"""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        # ESPHome installs its log handler on the stream current at setup;
+        # drop the previous request's handler so logs land in this capture
+        logging.getLogger().handlers.clear()
+        try:
+            returncode = run_esphome(["esphome", "config", config_path])
+        except SystemExit as e:
+            # sys.exit() with no code means success
+            returncode = 0 if e.code is None else (e.code if isinstance(e.code, int) else 1)
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            core.reset()
+
+    return {
+        'returncode': returncode or 0,
+        'stdout': stdout.getvalue(),
+        'stderr': stderr.getvalue()
+    }
+
+
+def main() -> int:
+    # Exiting here makes the runner fall back to spawning 'esphome config'
+    from esphome.__main__ import run_esphome
+    from esphome.core import CORE
+
+    out = sys.stdout
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request.get("op") == "validate":
+            response = validate(run_esphome, CORE, request["path"])
+        else:
+            response = {
+                'returncode': -1,
+                'stdout': '',
+                'stderr': f"Unknown op: {request.get('op')}"
+            }
+        out.write(json.dumps(response) + "\n")
+        out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,22 @@ Tests ESPHome configurations for validation, compilation, and simulation
 
 import pytest
 from pathlib import Path
+from typing import List
+
+from conftest import simulation_mode_enabled
+
+
+# Top-level keys every standalone config needs
+REQUIRED_COMPONENTS = {
+    "ups_hid": "ups_hid component",
+    "external_components": "external_components",
+    "esp32": "esp32 platform",
+}
+
+
+def tail_lines(text: str, n: int) -> List[str]:
+    """Last n lines of text, without splitting the whole string"""
+    return text.rsplit('\n', n)[-n:]
 
 
 class TestConfigurationValidation:
@@ -38,46 +54,32 @@ class TestConfigurationValidation:
         assert result['duration'] < 30, f"Validation too slow: {result['duration']}s"
     
     @pytest.mark.validation
-    def test_all_standalone_configs_validate(self, esphome_runner, test_configs):
+    def test_all_standalone_configs_validate(self, esphome_runner, config_path):
         """Test that all standalone test configs validate"""
-        failed_configs = []
-        
-        for config_path in test_configs:
-            result = esphome_runner.validate_config(config_path)
-            if not result['success']:
-                failed_configs.append({
-                    'config': config_path.name,
-                    'error': result['stderr']
-                })
+        result = esphome_runner.validate_config(config_path)
         
-        if failed_configs:
-            error_msg = "Failed validations:\n"
-            for fail in failed_configs:
-                error_msg += f"  - {fail['config']}: {fail['error'][:100]}...\n"
-            pytest.fail(error_msg)
+        if not result['success']:
+            pytest.fail(
+                f"Validation failed for {config_path.name}: "
+                f"{result['stderr'][:100]}..."
+            )
     
     @pytest.mark.validation
-    def test_configs_have_required_components(self, workspace_root, test_configs):
+    def test_configs_have_required_components(self, test_configs, parsed_configs):
         """Test that configs have required UPS HID components"""
         for config_path in test_configs:
-            with open(config_path) as f:
-                content = f.read()
+            doc = parsed_configs[config_path] or {}
             
             # Check for required components
-            assert "ups_hid:" in content, f"{config_path.name} missing ups_hid component"
-            assert "external_components:" in content, f"{config_path.name} missing external_components"
-            assert "esp32:" in content, f"{config_path.name} missing esp32 platform"
+            missing = [name for key, name in REQUIRED_COMPONENTS.items() if key not in doc]
+            assert not missing, f"{config_path.name} missing {', '.join(missing)}"
     
     @pytest.mark.validation
-    def test_simulation_configs_have_simulation_mode(self, test_configs):
+    def test_simulation_configs_have_simulation_mode(self, test_configs, parsed_configs):
         """Test that simulation configs have simulation_mode enabled"""
         for config_path in test_configs:
             if "simulation" in config_path.name:
-                with open(config_path) as f:
-                    content = f.read()
-                
-                assert ('simulation_mode: true' in content or 
-                       'simulation_mode: "true"' in content), \
+                assert simulation_mode_enabled(parsed_configs[config_path] or {}), \
                        f"{config_path.name} missing simulation_mode: true"
 
 
@@ -89,16 +91,16 @@ class TestConfigurationCompilation:
     @pytest.mark.parametrize("config", [
         "configs/testing/minimal_simulation.yaml",
     ], ids=lambda x: Path(x).stem)
-    def test_config_compilation_mandatory(self, esphome_runner, workspace_root, config):
+    def test_config_compilation_mandatory(self, compiled_configs, workspace_root, config):
         """MANDATORY: Test that configurations compile successfully"""
         config_path = workspace_root / config
         assert config_path.exists(), f"Config file {config} not found"
         
-        result = esphome_runner.compile_config(config_path, timeout=600)
+        result = compiled_configs[config_path]
         
         # Detailed failure reporting
         if not result['success']:
-            error_lines = result['stderr'].split('\n')[-20:]  # Last 20 lines
+            error_lines = tail_lines(result['stderr'], 20)  # Last 20 lines
             pytest.fail(
                 f"MANDATORY COMPILATION FAILED for {config}:\n"
                 f"Duration: {result['duration']}s\n"
@@ -111,84 +113,42 @@ class TestConfigurationCompilation:
     
     @pytest.mark.compilation
     @pytest.mark.slow
-    def test_all_standalone_configs_compile(self, esphome_runner, test_configs):
+    def test_all_standalone_configs_compile(self, compiled_configs, record_compilation, config_path):
         """MANDATORY: Test that all standalone configs compile"""
-        failed_compilations = []
-        compilation_times = []
+        print(f"\n🔨 Compiling {config_path.name}...")
+        result = compiled_configs[config_path]
+        record_compilation("compile", config_path, result)
         
-        for config_path in test_configs:
-            print(f"\n🔨 Compiling {config_path.name}...")
-            result = esphome_runner.compile_config(config_path, timeout=600)
-            
-            compilation_times.append({
-                'config': config_path.name,
-                'duration': result['duration'],
-                'success': result['success']
-            })
-            
-            if not result['success']:
-                error_lines = result['stderr'].split('\n')[-10:]
-                failed_compilations.append({
-                    'config': config_path.name,
-                    'duration': result['duration'],
-                    'error': "\n".join(error_lines)
-                })
-        
-        # Report compilation times
-        print("\n📊 Compilation Times:")
-        for time_info in compilation_times:
-            status = "✅" if time_info['success'] else "❌"
-            print(f"  {status} {time_info['config']}: {time_info['duration']}s")
-        
-        # Fail if any compilation failed
-        if failed_compilations:
-            error_msg = "MANDATORY COMPILATION FAILURES:\n"
-            for fail in failed_compilations:
-                error_msg += f"\n❌ {fail['config']} ({fail['duration']}s):\n{fail['error']}\n"
-            pytest.fail(error_msg)
+        if not result['success']:
+            error_lines = tail_lines(result['stderr'], 10)
+            pytest.fail(
+                f"MANDATORY COMPILATION FAILED for {config_path.name} "
+                f"({result['duration']}s):\n" + "\n".join(error_lines)
+            )
     
     @pytest.mark.compilation
     @pytest.mark.slow
-    def test_compilation_performance(self, esphome_runner, test_configs):
-        """Test compilation performance benchmarks"""
-        slow_compilations = []
-        
-        for config_path in test_configs:
-            result = esphome_runner.compile_config(config_path, timeout=600)
-            
-            if result['success'] and result['duration'] > 300:  # 5 minutes
-                slow_compilations.append({
-                    'config': config_path.name,
-                    'duration': result['duration']
-                })
-        
-        if slow_compilations:
-            warning_msg = "⚠️ Slow compilations (>5min):\n"
-            for slow in slow_compilations:
-                warning_msg += f"  - {slow['config']}: {slow['duration']}s\n"
-            print(warning_msg)  # Warning, not failure
+    def test_compilation_performance(self, compiled_configs, record_compilation, config_path):
+        """Test compilation performance benchmarks
+        
+        Slow compilations (>5min) are reported as a warning in the session
+        summary, not as failures.
+        """
+        result = compiled_configs[config_path]
+        record_compilation("performance", config_path, result)
 
 
 class TestSimulationMode:
     """Test simulation mode functionality"""
     
     @pytest.mark.simulation
-    @pytest.mark.parametrize("config", [
-        "configs/testing/minimal_simulation.yaml",
-        "configs/testing/simulation_test_standalone.yaml"
-    ])
-    def test_simulation_runs(self, esphome_runner, workspace_root, config):
+    @pytest.mark.slow
+    def test_simulation_runs(self, compiled_configs, simulation_config_path):
         """Test that simulation mode runs without hardware"""
-        config_path = workspace_root / config
-        
-        # Only test configs that have simulation enabled
-        with open(config_path) as f:
-            content = f.read()
-        
-        if not ('simulation_mode: true' in content or 'simulation_mode: "true"' in content):
-            pytest.skip(f"{config} doesn't have simulation mode enabled")
+        config_path = simulation_config_path
+        config = config_path.name
         
-        result = esphome_runner.run_simulation(config_path, duration=15)
+        result = compiled_configs.run_simulation(config_path)
         
         if not result['success']:
             pytest.fail(
@@ -202,11 +162,15 @@ class TestSimulationMode:
         assert result['success'], f"Simulation failed for {config}"
     
     @pytest.mark.simulation
-    def test_simulation_generates_sensor_data(self, esphome_runner, workspace_root):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("config", [
+        "configs/testing/simulation_test_standalone.yaml",
+    ], ids=lambda x: Path(x).stem)
+    def test_simulation_generates_sensor_data(self, compiled_configs, workspace_root, config):
         """Test that simulation generates realistic sensor data"""
-        config_path = workspace_root / "configs/testing/simulation_test_standalone.yaml"
+        config_path = workspace_root / config
         
-        result = esphome_runner.run_simulation(config_path, duration=20)
+        result = compiled_configs.run_simulation(config_path)
         
         assert result['success'], "Simulation failed to run"
         
@@ -232,39 +196,28 @@ class TestProductionConfigs:
     """Test production configuration examples"""
     
     @pytest.mark.validation
-    def test_production_configs_validate(self, esphome_runner, production_configs):
+    def test_production_configs_validate(self, esphome_runner, production_config_path):
         """Test that production example configs validate (may need secrets)"""
-        failed_configs = []
-        
-        for config_path in production_configs:
-            result = esphome_runner.validate_config(config_path)
-            
-            # Production configs may fail due to missing secrets or duplicate entities - that's OK for examples
-            if not result['success']:
-                full_output = result['stderr'] + result['stdout']
-                if ("secrets.yaml" in full_output or 
-                    "!secret" in full_output or
-                    "Duplicate" in full_output or
-                    "Each entity must have a unique name" in full_output):
-                    pytest.skip(f"{config_path.name} has expected production config issues")
-                else:
-                    failed_configs.append({
-                        'config': config_path.name,
-                        'error': result['stderr']
-                    })
+        result = esphome_runner.validate_config(production_config_path)
         
-        if failed_configs:
-            error_msg = "Production config validation failures (excluding secrets):\n"
-            for fail in failed_configs:
-                error_msg += f"  - {fail['config']}: {fail['error'][:100]}...\n"
-            pytest.fail(error_msg)
+        # Production configs may fail due to missing secrets or duplicate entities - that's OK for examples
+        if not result['success']:
+            full_output = result['stderr'] + result['stdout']
+            if ("secrets.yaml" in full_output or 
+                "!secret" in full_output or
+                "Duplicate" in full_output or
+                "Each entity must have a unique name" in full_output):
+                pytest.skip(f"{production_config_path.name} has expected production config issues")
+            pytest.fail(
+                "Production config validation failure (excluding secrets):\n"
+                f"  - {production_config_path.name}: {result['stderr'][:100]}..."
+            )
     
     @pytest.mark.validation
-    def test_production_configs_have_device_specifics(self, production_configs):
+    def test_production_configs_have_device_specifics(self, production_configs, config_contents):
         """Test that production configs have device-specific settings"""
         for config_path in production_configs:
-            with open(config_path) as f:
-                content = f.read()
+            content = config_contents[config_path]
             
             # Should include device-specific packages
             has_device_package = any(
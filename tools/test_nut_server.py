@@ -4,19 +4,26 @@ Test script for NUT Server Component
 Tests basic NUT protocol commands against ESPHome NUT server
 """
 
+import selectors
 import socket
 import sys
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 
 class NutClient:
     """Simple NUT protocol client for testing."""
     
+    # Upper bound on the total time spent waiting for one command's response
+    COMMAND_TIMEOUT = 5.0
+    
     def __init__(self, host, port=3493):
         self.host = host
         self.port = port
         self.sock = None
+        self.selector = None
+        self.buffer = bytearray()
         
     def connect(self):
         """Connect to NUT server."""
@@ -24,6 +31,12 @@ class NutClient:
         self.sock.settimeout(5.0)
         try:
             self.sock.connect((self.host, self.port))
+            # Commands are small request/response writes; don't let Nagle delay them
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Reads wait on the selector against a per-command deadline
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.sock, selectors.EVENT_READ)
+            self.buffer.clear()
             return True
         except Exception as e:
             print(f"Connection failed: {e}")
@@ -32,47 +45,95 @@ class NutClient:
     def disconnect(self):
         """Disconnect from server."""
         if self.sock:
+            if self.selector:
+                self.selector.close()
             self.sock.close()
             self.sock = None
+            self.selector = None
+        self.buffer.clear()
     
     def send_command(self, command):
         """Send command and get response."""
+        responses = self.send_batch([command])
+        return None if responses is None else responses[0]
+    
+    def send_batch(self, commands):
+        """Pipeline commands in a single write and get one response per command.
+        
+        A timeout or error disconnects the client: replies still in flight
+        would otherwise be paired with later commands. Later calls return None.
+        """
         if not self.sock:
             return None
         
+        responses = []
+        lines = []
+        failure = None
         try:
-            # Send command
-            self.sock.send(f"{command}\n".encode())
+            # Send all commands at once
+            self.sock.sendall(("\n".join(commands) + "\n").encode())
             
-            # Receive response
-            response = ""
-            while True:
-                data = self.sock.recv(1024).decode()
-                if not data:
-                    break
-                response += data
-                
-                # Check for end markers
-                if "OK" in data or "ERR" in data:
-                    break
-                if command.startswith("LIST") and "END LIST" in data:
-                    break
-                if command == "HELP" and "\n" in data:
-                    break
-                if command in ["VERSION", "UPSDVER"] and "\n" in data:
-                    break
-                    
-            return response.strip()
+            # Responses arrive in command order
+            for _ in commands:
+                lines = []
+                deadline = time.monotonic() + self.COMMAND_TIMEOUT
+                responses.append(self._read_response(lines, deadline))
             
         except socket.timeout:
-            return response.strip() if response else "TIMEOUT"
+            failure = "TIMEOUT"
+            # Report an unterminated trailing line too, and drop it so it
+            # isn't prepended to the next command's response
+            lines.append(bytes(self.buffer))
+            self.buffer.clear()
+            response = b"".join(lines).decode(errors="replace").strip()
+            responses.append(response if response else failure)
+            self.disconnect()
         except Exception as e:
-            return f"ERROR: {e}"
+            failure = f"ERROR: {e}"
+            responses.append(failure)
+            self.disconnect()
+        
+        # Commands left unanswered share the failure that stopped the batch
+        responses += [failure] * (len(commands) - len(responses))
+        return responses
+    
+    def _read_response(self, lines, deadline):
+        """Read one response into lines: one line, or BEGIN LIST ... END LIST."""
+        for line in iter(lambda: self._readline(deadline), b""):
+            lines.append(line)
+            if not lines[0].startswith(b"BEGIN LIST"):
+                break
+            if line.startswith(b"END LIST") or line.startswith(b"ERR"):
+                break
+        return b"".join(lines).decode(errors="replace").strip()
+    
+    def _readline(self, deadline):
+        """Read one line, raising socket.timeout once deadline passes.
+        
+        Returns b"" when the server has closed the connection.
+        """
+        while True:
+            end = self.buffer.find(b"\n")
+            if end != -1:
+                line = bytes(self.buffer[:end + 1])
+                del self.buffer[:end + 1]
+                return line
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.selector.select(timeout=remaining):
+                raise socket.timeout("timed out")
+            
+            data = self.sock.recv(8192)
+            if not data:
+                line = bytes(self.buffer)
+                self.buffer.clear()
+                return line
+            self.buffer += data
     
     def login(self, username, password):
         """Authenticate with server."""
         response = self.send_command(f"LOGIN {username} {password}")
-        return "OK" in response
+        return response is not None and "OK" in response
     
     def logout(self):
         """Logout from server."""
@@ -89,11 +150,10 @@ def test_basic_commands(client):
         "UPSDVER",
     ]
     
-    for cmd in commands:
+    responses = client.send_batch(commands) or [None] * len(commands)
+    for cmd, response in zip(commands, responses):
         print(f"\n> {cmd}")
-        response = client.send_command(cmd)
         print(f"< {response}")
-        time.sleep(0.1)
 
 
 def test_authenticated_commands(client, username, password, ups_name):
@@ -108,8 +168,6 @@ def test_authenticated_commands(client, username, password, ups_name):
         print("< ERR - Login failed")
         return
     
-    time.sleep(0.1)
-    
     # Test authenticated commands
     commands = [
         "LIST UPS",
@@ -123,8 +181,7 @@ def test_authenticated_commands(client, username, password, ups_name):
     for cmd in commands:
         print(f"\n> {cmd}")
         response = client.send_command(cmd)
-        print(f"< {response[:500]}")  # Truncate long responses
-        time.sleep(0.1)
+        print(f"< {str(response)[:500]}")  # Truncate long responses
     
     # Logout
     print("\n> LOGOUT")
@@ -170,23 +227,35 @@ def test_error_handling(client, ups_name):
         "LIST",   # Missing subcommand
     ]
     
-    for cmd in invalid_commands:
+    responses = client.send_batch(invalid_commands) or [None] * len(invalid_commands)
+    for cmd, response in zip(invalid_commands, responses):
         print(f"\n> {cmd}")
-        response = client.send_command(cmd)
         print(f"< {response}")
-        time.sleep(0.1)
+
+
+def _spawn_client(host, port):
+    """Connect a client and query VERSION; returns (client or None, response)."""
+    client = NutClient(host, port)
+    if not client.connect():
+        client.disconnect()
+        return None, None
+    return client, client.send_command("VERSION")
 
 
 def test_concurrent_connections(host, port, num_clients=3):
     """Test multiple concurrent connections."""
     print(f"\n=== Testing {num_clients} Concurrent Connections ===")
     
+    # Connect all clients at once so the server really sees them overlap
+    with ThreadPoolExecutor(max_workers=num_clients) as executor:
+        results = list(executor.map(
+            lambda _: _spawn_client(host, port), range(num_clients)
+        ))
+    
     clients = []
-    for i in range(num_clients):
-        client = NutClient(host, port)
-        if client.connect():
+    for i, (client, response) in enumerate(results):
+        if client:
             print(f"Client {i+1}: Connected")
-            response = client.send_command("VERSION")
             print(f"Client {i+1}: {response}")
             clients.append(client)
         else: